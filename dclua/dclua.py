@@ -66,7 +66,31 @@ Suggested structure of noun model:
 
 """
 
-from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from os.path import commonprefix
+import re
+from sys import intern
+
+
+# Replacements made by `Declensor._fitOrthography`.
+_ORTHOGRAPHY = {
+    # йа -> я, йі -> ї, йу -> ю, йе -> є.
+    '\u0439\u0430': '\u044f',
+    '\u0439\u0456': '\u0457',
+    '\u0439\u0443': '\u044e',
+    '\u0439\u0435': '\u0454',
+
+    # ьа -> я, ьі -> і, ьу -> ю, ье -> є
+    '\u044c\u0430': '\u044f',
+    '\u044c\u0456': '\u0456',
+    '\u044c\u0443': '\u044e',
+    '\u044c\u0435': '\u0454'
+}
+
+# Every replaced digraph is one of [йь] followed by one of [аіуе], so a pair
+# of character classes matches them without trying 8 alternatives.
+_ORTHOGRAPHY_RE = re.compile('[\u0439\u044c][\u0430\u0456\u0443\u0435]')
 
 
 class Declensor:
@@ -74,6 +98,9 @@ class Declensor:
     for declension.
     """
 
+    # Number of the latest `declense` results to remember.
+    CACHE_SIZE = 65536
+
     def __init__(self, rules):
         """Initialize Declensor with the given rules.
 
@@ -82,114 +109,274 @@ class Declensor:
 
         """
 
+        self._createCaches()
         self.setModel(rules)
 
+    def __getstate__(self):
+        """Caches are bound to this instance and keyed by ids of its rules,
+        so they are left out of pickles and copies.
+        """
+
+        state = self.__dict__.copy()
+
+        for name in ('_declenseCached', '_findWordCached', '_coordCache'):
+            del state[name]
+
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state and create new caches for this instance."""
+
+        self.__dict__.update(state)
+        self._createCaches()
+
+        self._coordCache = {
+            (id(rule), coords): suffix
+            for rule in self.rules
+            for suffix, coords in Declensor._iterSuffixes(rule)
+        }
+
+    def _createCaches(self):
+        """Create the caches of `declense` and suffix recognition, which call
+        methods of this instance.
+        """
+
+        self._declenseCached = lru_cache(maxsize=self.CACHE_SIZE)(
+            self._declense)
+        self._findWordCached = lru_cache(maxsize=self.CACHE_SIZE)(
+            self._findWordInModel)
+
     @staticmethod
     def getZero(li: list):
         """Returns zero-coordinate of `li`. This method is static in order to
-        use it in DeclenseTrainer.
+        use it in DeclenseTrainer. Rules frozen by `setModel` are nested
+        tuples, so both containers are walked.
         """
 
-        if type(li) is list:
-            return Declensor.getZero(li[0])
-        else:
-            return li
+        while li.__class__ is list or li.__class__ is tuple:
+            li = li[0]
+
+        return li
 
     def setModel(self, rules):
         """Set given iterable of rules as the working one. Do not assign your
         rules to Declensor.rules without this function, because they should
-        be sorted in a specific way before use.
+        be sorted in a specific way before use. Rules are stored as nested
+        tuples, so they can't be changed after that. Repeated rules are
+        stored once. Rules read from Declensor.rules can be passed back.
 
         Args:
             rules (iterable)
 
         """
 
-        self.rules = sorted(
-            rules,
-            key=lambda model: len(Declensor.getZero(model)),
-            reverse=True
-        )
+        # Frozen rules are hashable, so the dict drops duplicates and keeps
+        # the order of the first occurrences.
+        self.rules = list(dict.fromkeys(
+            Declensor._freeze(rule)
+            for rule in sorted(
+                rules,
+                key=lambda model: len(Declensor.getZero(model)),
+                reverse=True
+            )
+        ))
+
+        # Flat table of all the suffixes: (suffix, rule, coordinates). Equal
+        # coordinates of different rules share one tuple.
+        vectors = dict()
+        cells = [
+            (suffix, rule, vectors.setdefault(coords, coords))
+            for rule in self.rules
+            for suffix, coords in Declensor._iterSuffixes(rule)
+        ]
+
+        self._trie = Declensor._buildSuffixTrie(cells)
+        self._cells = Declensor._buildCellIndex(cells)
+
+        # Elements found by `_getByCoord`, keyed by (id(rule), coordinates).
+        # Coordinates of all the suffixes are known already, so they are put
+        # here in advance and only other vectors have to walk the rule.
+        self._coordCache = {
+            (id(rule), coords): suffix
+            for suffix, rule, coords in cells
+        }
+
+        # Suffix of a word depends only on its last letters. One more letter
+        # than the longest suffix is kept, so a word, which is not longer
+        # than the longest suffix, is still recognized as a whole word.
+        self._tailSize = max((len(cell[0]) for cell in cells), default=0) + 1
+
+        # Results for the old model are not valid anymore.
+        self._declenseCached.cache_clear()
+        self._findWordCached.cache_clear()
 
     @staticmethod
-    def _fitOrthography(word):
-        """Fix some orthography mistakes, which can happen after declension.
+    def _freeze(rule):
+        """Convert nested lists of the rule into nested tuples. Suffixes are
+        interned, so the same suffixes of different rules are stored once.
 
         Args:
-            word (str)
+            rule (list)
 
         Returns:
-            str
+            tuple
 
         """
 
-        replacements = [
-            # йа -> я, йі -> ї, йу -> ю, йе -> є.
-            ('\u0439\u0430', '\u044f'),
-            ('\u0439\u0456', '\u0457'),
-            ('\u0439\u0443', '\u044e'),
-            ('\u0439\u0435', '\u0454'),
-
-            # ьа -> я, ьі -> і, ьу -> ю, ье -> є
-            ('\u044c\u0430', '\u044f'),
-            ('\u044c\u0456', '\u0456'),
-            ('\u044c\u0443', '\u044e'),
-            ('\u044c\u0435', '\u0454')
-        ]
+        if rule.__class__ is list:
+            return tuple(Declensor._freeze(el) for el in rule)
+        elif rule.__class__ is str:
+            return intern(rule)
+        else:
+            return rule
+
+    @staticmethod
+    def _iterSuffixes(rule):
+        """Walk through the rule and yield every suffix with its coordinates.
+        Suffixes are yielded in the same order the recursive search visited
+        them: depth-first, from the lowest index.
+
+        Args:
+            rule (tuple)
+
+        Yields:
+            tuple:
+                [0]: Suffix.
+                [1]: Coordinates.
+
+        """
 
-        for old, new in replacements:
-            word = word.replace(old, new)
+        # Indices of the tuples we went into and iterators over them. The
+        # coordinates are materialized only for the suffixes.
+        path = list()
+        stack = [enumerate(rule)]
 
-        return word
+        while stack:
+            for index, el in stack[-1]:
+                if el.__class__ is tuple:
+                    path.append(index)
+                    stack.append(enumerate(el))
+                    break
+
+                if el:
+                    yield el, (*path, index)
+            else:
+                stack.pop()
+                if path:
+                    path.pop()
 
-    def _findInRule(self, word: str, rule):
-        """Search suffix of given word in the rule and return its coordinates.
+    @staticmethod
+    def _buildSuffixTrie(cells):
+        """Build a trie of reversed suffixes of all the given cells, so the
+        suffix of a word can be found by walking its letters from the end.
+
+        Each node is a list of two elements: a dict, which maps the first
+        letter of an edge (counting from the end of the word) to a tuple
+        (label, length of the label, node), and a list of matches (suffix,
+        rule, coordinates) in the order of `cells`. Chains of nodes without
+        matches are compressed into a single edge with a longer label. Labels
+        keep their letters in the order they have in the word, so they can be
+        checked with `str.endswith` without reversing the word.
 
         Args:
-            word (str): Word to look for.
-            rule (list): Rule to search in.
+            cells (list): Tuples (suffix, rule, coordinates) in the order of
+                sorted rules.
 
         Returns:
-            tuple:
-                [0]: Found suffix.
-                [1]: Coordinates.
+            list: Root node.
 
         """
 
-        def _search(li: list, word):
-            """Recursive function for searching in list. Each recursion
-            `coords` list increase with new coordinate.
-            Complexity is n^d, where d is dimensionality, but at worst case
-            d=4 with n<10, so that not so much.
+        root = [dict(), list()]
 
-            Returns:
-                str: Found suffix.
+        for cell in cells:
+            node = root
+            for letter in reversed(cell[0]):
+                node = node[0].setdefault(letter, [dict(), list()])
+            node[1].append(cell)
 
+        def _compress(node):
+            """Replace children of the node with (label, length, node) edges,
+            merging unary chains on the way.
             """
 
-            for index, el in enumerate(li):
+            edges = dict()
 
-                # Do not allow to declense whole words as suffixes
-                if not el or len(el) == len(word):
-                    continue
+            for letter, child in node[0].items():
+                label = letter
+                while not child[1] and len(child[0]) == 1:
+                    (nextLetter, child), = child[0].items()
+                    label = nextLetter + label
+                edges[letter] = (label, len(label), _compress(child))
 
-                if el == word[-len(el):]:
-                    return el
+            node[0] = edges
+            return node
 
-                if type(el) is list:
-                    found = _search(el, word)
-                    if found:
-                        return found
-            return None
+        return _compress(root)
+
+    @staticmethod
+    def _buildCellIndex(cells):
+        """Group suffixes by their coordinates, their last letter and then by
+        their length, so the suffix of a word with known morphology can be
+        found with one dict lookup per length of suffixes, which end with the
+        same letter as the word.
+
+        Args:
+            cells (list): Tuples (suffix, rule, coordinates) in the order of
+                sorted rules.
+
+        Returns:
+            dict:
+                key (tuple): Coordinates.
+                value (dict): Maps the last letter to the list of tuples
+                    (length, suffixes), where `suffixes` is a dict which maps
+                    suffix to the first rule containing it. Sorted by length
+                    descending.
+
+        """
+
+        index = dict()
+
+        for suffix, rule, coords in cells:
+            index.setdefault(coords, dict()).setdefault(
+                suffix[-1], dict()).setdefault(
+                len(suffix), dict()).setdefault(suffix, rule)
+
+        return {
+            coords: {
+                letter: sorted(lengths.items(), reverse=True)
+                for letter, lengths in letters.items()
+            }
+            for coords, letters in index.items()
+        }
+
+    @staticmethod
+    def _fitOrthography(word):
+        """Fix some orthography mistakes, which can happen after declension.
+        All the replacements are done in a single pass over the word.
 
-        return _search(rule, word)
+        Args:
+            word (str)
+
+        Returns:
+            str
+
+        """
+
+        # Most of words have neither й nor ь, so the regex is not needed.
+        if '\u0439' not in word and '\u044c' not in word:
+            return word
+
+        return _ORTHOGRAPHY_RE.sub(
+            lambda match: _ORTHOGRAPHY[match.group()], word)
 
     def _findWordInModel(self, word):
         """Search suffix of given word in bundle of rules.
 
-        ! This function might cost pretty much.
-        Complexity is m*n^d, where m is number of rules, n is an average
-        number of subarrays on each level and d is dimensionality.
+        The word is walked through the suffix trie from its last letter, so
+        complexity is O(k), where k is the length of the longest suffix in the
+        model. The longest suffix found wins; among rules with the same suffix
+        the first one in `self.rules` is taken.
 
         Args:
             word (str): Word to look for.
@@ -201,19 +388,43 @@ class Declensor:
 
         """
 
-        for rule in self.rules:
-            found = self._findInRule(word, rule)
-            if found:
-                return found, rule
+        size = len(word)
+        node = self._trie
+        depth = 0
+        found = None
+
+        while True:
+            edges, matches = node
+
+            # Do not allow to declense whole words as suffixes
+            if depth == size:
+                break
+
+            if matches:
+                found = matches[0]
+
+            edge = edges.get(word[size - depth - 1])
+            if edge is None:
+                break
+
+            label, labelSize, node = edge
+            if not word.endswith(label, 0, size - depth):
+                break
+
+            depth += labelSize
+
+        if found:
+            return found[0], found[1]
 
         return None
 
     def _getByCoord(self, array, vector):
         """Return element from `array` which coordinates was passed by
-        `vector`.
+        `vector`. Suffixes of the rules are found in the cache filled by
+        `setModel`, other results are cached until the model is changed.
 
         Args:
-            array (list): Multidimensional array to search in.
+            array (tuple): Multidimensional array to search in.
             vector (list, tuple): Coordinates of element to return.
 
         Returns:
@@ -221,17 +432,31 @@ class Declensor:
 
         """
 
-        if vector and type(array) is list:
-            try:
-                return self._getByCoord(
-                    array[vector[0]], vector[1:])
-            except IndexError:
-                return None
-        else:
-            return array
+        key = (id(array), tuple(vector))
+
+        try:
+            return self._coordCache[key]
+        except KeyError:
+            pass
+
+        element = array
+
+        for index in vector:
+            if element.__class__ is not tuple:
+                break
+
+            if not -len(element) <= index < len(element):
+                element = None
+                break
+
+            element = element[index]
+
+        self._coordCache[key] = element
+        return element
 
     def _findRule(self, word, properties):
-        """Find rule of declension of suffix of the given word.
+        """Find rule of declension of suffix of the given word. The longest
+        suffix placed at `properties` wins.
 
         Args:
             word (str): Given word.
@@ -245,13 +470,22 @@ class Declensor:
 
         """
 
-        for rule in self.rules:
-            suffix = self._getByCoord(rule, properties)
+        if not word:
+            return None
+
+        wordSize = len(word)
+        letters = self._cells.get(tuple(properties), {})
+
+        for size, suffixes in letters.get(word[-1], ()):
+
+            # Suffixes longer than the word can't match it.
+            if size > wordSize:
+                continue
 
-            if not suffix:
-                return None
+            suffix = word[-size:]
+            rule = suffixes.get(suffix)
 
-            if word[-len(suffix):] == suffix:
+            if rule is not None:
                 return suffix, rule
 
         # The edge case.
@@ -263,7 +497,7 @@ class Declensor:
         Args:
             word (str): Given word.
             suffix (str): Suffix to replace.
-            rule (list): Rule of declension for this suffix.
+            rule (tuple): Rule of declension for this suffix.
             properties (list, tuple): Coordinates of new suffix.
 
         Returns:
@@ -271,12 +505,37 @@ class Declensor:
 
         """
 
-        newsuffix = self._getByCoord(rule, properties)
+        return Declensor._replaceSuffix(
+            word, len(suffix), self._getByCoord(rule, properties))
+
+    @staticmethod
+    def _replaceSuffix(word, size, newsuffix):
+        """Replace last `size` letters of the word with `newsuffix`. Length of
+        the old suffix is passed instead of the suffix itself, because the
+        callers know it already. Orthography is fixed on the way (see
+        `_fitOrthography`): root of the word and the new suffix are correct on
+        their own, so mistakes can appear only where they meet.
+
+        Args:
+            word (str): Given word.
+            size (int): Length of the suffix to replace.
+            newsuffix (str): Suffix to put instead.
+
+        Returns:
+            str: Result.
+
+        """
 
-        if not suffix or not newsuffix:
+        if not size or not newsuffix:
             return word
 
-        return word[:-len(suffix)] + self._getByCoord(rule, properties)
+        root = word[:-size]
+        fixed = _ORTHOGRAPHY.get(root[-1:] + newsuffix[:1])
+
+        if fixed:
+            return root[:-1] + fixed + newsuffix[1:]
+
+        return root + newsuffix
 
     def declense(self, word, newmorph, morphology=None) -> str:
         """Declense word with given `morphology` to `newmorph` which determines
@@ -285,7 +544,9 @@ class Declensor:
 
         ! Finding appropriate declension rule in model is a little bit
         expensive procedure, so if you know the morphology of passing word,
-        it's better to cal this function with `morphology`.
+        it's better to cal this function with `morphology`. Latest results are
+        cached (see `CACHE_SIZE`), so repeated words are declensed only once
+        until the model is changed with `setModel`.
 
         Args:
             word (str): Given word.
@@ -297,8 +558,95 @@ class Declensor:
 
         """
 
+        return self._declenseCached(
+            word,
+            tuple(newmorph),
+            tuple(morphology) if morphology else None
+        )
+
+    def declenseMany(self, words, newmorph, morphology=None) -> list:
+        """Declense every word of `words` to `newmorph`. Works just the same as
+        calling `declense` for each of them, but when `morphology` is given,
+        suffixes for both forms are resolved only once (see
+        `compileTransform`).
+
+        Args:
+            words (iterable): Given words.
+            newmorph (list/tuple): New morphology coordinates.
+            morphology (list/tuple): Old morphology coordinates.
+
+        Returns:
+            list: Results in the order of `words`.
+
+        """
+
+        if morphology:
+            transform = self.compileTransform(morphology, newmorph)
+        else:
+            newmorph = tuple(newmorph)
+
+            def transform(word):
+                return self._declenseCached(word, newmorph, None)
+
+        return [transform(word) for word in words]
+
+    def compileTransform(self, morphology, newmorph):
+        """Prepare declension of words with the given `morphology` to
+        `newmorph`. Suffixes for both forms are resolved once, so the returned
+        function only has to find the suffix of the word. Works just the same
+        as `declense` with `morphology`, but is faster when a lot of words
+        have to be moved between the same forms.
+
+        The function is bound to the current model, so call this method again
+        after `setModel`.
+
+        Args:
+            morphology (list/tuple): Old morphology coordinates.
+            newmorph (list/tuple): New morphology coordinates.
+
+        Returns:
+            callable: Function which takes a word and returns declensed one.
+                It raises ModelError when no rule is found.
+
+        """
+
+        # The same buckets as in `_findRule`, but every suffix is mapped to
+        # the new one instead of its rule.
+        transforms = {
+            letter: [
+                (size, {
+                    suffix: self._getByCoord(rule, newmorph)
+                    for suffix, rule in suffixes.items()
+                })
+                for size, suffixes in buckets
+            ]
+            for letter, buckets in self._cells.get(
+                tuple(morphology), {}).items()
+        }
+
+        def transform(word):
+            wordSize = len(word)
+
+            for size, suffixes in transforms.get(word[-1:], ()):
+                if size > wordSize:
+                    continue
+
+                suffix = word[-size:]
+                if suffix in suffixes:
+                    return Declensor._replaceSuffix(
+                        word, size, suffixes[suffix])
+
+            raise ModelError("No appropriate rule for this form found.")
+
+        return transform
+
+    def _declense(self, word, newmorph, morphology):
+        """Uncached version of `declense`. Coordinates should be given as
+        tuples.
+        """
+
         if not morphology:
-            rule = self._findWordInModel(word)
+            rule = self._findWordCached(word[-self._tailSize:])
         else:
             rule = self._findRule(word, morphology)
 
@@ -306,8 +654,7 @@ class Declensor:
         if not rule:
             raise ModelError("No appropriate rule for this form found.")
 
-        return Declensor._fitOrthography(
-            self._changeProperties(word, *rule, newmorph))
+        return self._changeProperties(word, *rule, newmorph)
 
 
 class ModelError(Exception):
@@ -331,6 +678,14 @@ class DeclenseTrainer:
         list("\u0448\u0447\u0449\u0441")
     ]
 
+    # Minimal number of independent tasks (words to analyze or rules to
+    # generalize), which are distributed among processes. None (default)
+    # never starts them. Each task takes tens of microseconds, so processes
+    # pay off only for very large batches on several cores. The calling
+    # script has to guard its entry point with `if __name__ == "__main__":`,
+    # because child processes may import it again.
+    PARALLEL_THRESHOLD = None
+
     @staticmethod
     def _getRootSize(words):
         """Returns the size of unchangeable part of the words in array.
@@ -343,35 +698,12 @@ class DeclenseTrainer:
 
         """
 
-        def _compareTwo(word1, word2) -> int:
-            """Returns the size of common part of two words.
-            """
-
-            counter = 0
-            for a, b in zip(word1, word2):
-                if a == b:
-                    counter += 1
-                else:
-                    break
-
-            return counter
-
-        comparator = None
-
-        for word in words:
-
-            # Remember and skip the first word.
-            if not comparator:
-                comparator = word
-                continue
-
-            # Remember the common part
-            comparator = word[:_compareTwo(word, comparator)]
-
-        return len(comparator)
+        # commonprefix compares only the lexicographically smallest and
+        # largest words, their common part is common for all of them.
+        return len(commonprefix(list(words)))
 
     @staticmethod
-    def analyze(declensions, minsize=2):
+    def analyze(declensions, minsize=2, sparse=False) -> list:
         """Produce the declension rule for given word.
 
         Args:
@@ -380,60 +712,147 @@ class DeclenseTrainer:
                     this module for details.
                 value (str): Form of the word.
             minsize (int): Minimal size of the suffix.
+            sparse (bool): Ignore empty forms when looking for the root, so
+                they don't shorten it. Their suffixes are left empty.
 
         Returns:
-            list: Produced rule.
+            list: Produced rule. It consists only of nested lists, strings
+                and None for the gaps, so it can be serialized as is.
 
         """
 
-        def _enlargeList(array, index):
-            """Enlarge array, so it will contain given index. Fill the gaps
-            with None.
-            """
-
-            while len(array) <= index:
-                array.append(None)
-
-            if array[index] is None:
-                array[index] = []
-
-        def _insertInto(array, value, index, *vector):
-            """Insert `value` into given `array` into some coordinates. Example
-            of use:
-            >>> _insertInto([], "!", 0, 0, 1)
-            <<< [[[None, "!"]]]
-            """
-
-            _enlargeList(array, index)
-
-            if not vector:
-                array[index] = value
+        forms = list(declensions.values())
 
-            else:
-                _insertInto(array[index], value, *vector)
+        if sparse:
+            forms = [form for form in forms if form]
 
-        rootSize = DeclenseTrainer._getRootSize(declensions.values())
+        rootSize = DeclenseTrainer._getRootSize(forms)
 
         # Decrease rootSize, when suffixes are less than minsize
-        for word in declensions.values():
+        for word in forms:
             diff = minsize - len(word[rootSize:])
             if diff > 0:
                 rootSize -= diff
 
-        rule = list()
+        # Length of every list of the rule, keyed by coordinates of the list.
+        # Lists are created at once with their final size and gaps are left
+        # as None.
+        sizes = dict()
+
+        for vector in declensions:
+            for depth, index in enumerate(vector):
+                prefix = vector[:depth]
+                if sizes.get(prefix, 0) <= index:
+                    sizes[prefix] = index + 1
+
+        rule = [None] * sizes.get((), 0)
 
         for vector, form in declensions.items():
-            _insertInto(rule, form[rootSize:], *vector)
+            array = rule
+
+            for depth, index in enumerate(vector[:-1], 1):
+                if array[index] is None:
+                    array[index] = [None] * sizes[vector[:depth]]
+                array = array[index]
+
+            array[vector[-1]] = form[rootSize:]
 
         return rule
 
     @staticmethod
-    def createModel(words, minsize=2):
+    def createModel(words, minsize=2) -> list:
         """Syntactic sugar for `analyze` method. Works just the same, but with
-        the list of words.
+        the list of words. Large lists can be analyzed in separate processes
+        (see `PARALLEL_THRESHOLD`).
+        """
+
+        return DeclenseTrainer._map(
+            DeclenseTrainer.analyze, [(word, minsize) for word in words])
+
+    @staticmethod
+    def _map(function, arguments):
+        """Call `function` with every tuple of `arguments`. When
+        `PARALLEL_THRESHOLD` is set and there are at least that many calls,
+        they are distributed among processes.
+
+        Args:
+            function (callable): Function, which can be pickled.
+            arguments (list): Tuples of positional arguments.
+
+        Returns:
+            list: Results in the order of `arguments`.
+
         """
 
-        return [DeclenseTrainer.analyze(word, minsize) for word in words]
+        threshold = DeclenseTrainer.PARALLEL_THRESHOLD
+
+        if threshold is None or len(arguments) < threshold:
+            return [function(*args) for args in arguments]
+
+        with ProcessPoolExecutor() as executor:
+            return list(
+                executor.map(function, *zip(*arguments), chunksize=64))
+
+    @staticmethod
+    def _generalize(rule, index, group) -> list:
+        """Returns a list of rules generalized to a given group. This method
+        is not nested into `generalizeModel`, so it can be sent to another
+        process.
+
+        Args:
+            rule (list)
+            index (int): Index of the letter which will be generalized.
+                >>> _generalize(
+                        ['abc', ...],
+                        index=1,
+                        group=['b', 'w', 'v'])
+                <<< [['abc', ...], ['awc', ...], [avc, ...]]
+
+        """
+
+        # Strings of the rule in the order of a depth-first walk.
+        leaves = list()
+
+        def _flatten(array):
+            """Goes through array recursively, collects its strings into
+            `leaves` and returns a skeleton of the array, where every string
+            is replaced by its index in `leaves`.
+            """
+
+            skeleton = list()
+
+            for el in array:
+                if el.__class__ is str:
+                    skeleton.append(len(leaves))
+                    leaves.append(el)
+                else:
+                    skeleton.append(_flatten(el))
+
+            return skeleton
+
+        def _rebuild(skeleton, strings):
+            """Returns a copy of the rule from its skeleton, taking strings
+            from `strings` by their indices.
+            """
+
+            return [
+                strings[el] if el.__class__ is int else _rebuild(el, strings)
+                for el in skeleton
+            ]
+
+        skeleton = _flatten(rule)
+
+        # Empty suffixes are forms the word doesn't have, so they are left
+        # empty.
+        return [
+            _rebuild(skeleton, [
+                Declensor._fitOrthography(
+                    leaf[:index] + letter + leaf[index + 1:]
+                ) if leaf else leaf
+                for leaf in leaves
+            ])
+            for letter in group
+        ]
 
     @staticmethod
     def generalizeModel(model, groups: list, threshold=.3):
@@ -446,7 +865,9 @@ class DeclenseTrainer:
         on.
 
         You can give as many groups of letters as you want. It depends on the
-        morphology rules of the words you're going to make model for.
+        morphology rules of the words you're going to make model for. Rules
+        are generalized in the calling process, unless `PARALLEL_THRESHOLD`
+        is set.
 
         Args:
             model (list)
@@ -462,42 +883,12 @@ class DeclenseTrainer:
 
         """
 
-        def _generalize(rule, index, group) -> list:
-            """Returns a list of rules generalized to a given group.
-
-            Args:
-                index (int): Index of the letter which will be generalized.
-                    >>> _generalize(
-                            ['abc', ...],
-                            index=1,
-                            group=['b', 'w', 'v'])
-                    <<< [['abc', ...], ['awc', ...], [avc, ...]]
-
-            """
-
-            def _putRecursively(l, index, array):
-                """Goes through array recursively and put a given letter `l`
-                onto given `index`, if element is a string.
-                """
-                for i, el in enumerate(array):
-                    if type(el) is str:
-                        array[i] = Declensor._fitOrthography(
-                            el[:index] + l + el[index + 1:])
-                    else:
-                        array[i] = _putRecursively(l, index, el)
-                return array
-
-            return [
-                _putRecursively(letter, index, deepcopy(rule))
-                for letter in group
-            ]
-
         def _deleteGroup(array, group, index):
             """Delete all group members from a given array.
 
             Args:
                 array (iterable)
-                group (list)
+                group (frozenset)
                 index (int): An index of letter to be compared with the group's
                     one.
 
@@ -508,35 +899,65 @@ class DeclenseTrainer:
             counter = 0
 
             for rule in array:
-                try:
-                    if (
-                        Declensor.getZero(rule)[index] not in group or (
-                            deleted and
-                            not _rulesAreIdentical(deleted, rule, index)
-                        )
-                    ):
-                        result.append(rule)
-                    else:
-                        deleted = rule
-                        counter += 1
-                except IndexError:
+                zero = Declensor.getZero(rule)
+
+                # Rules with shorter infinitive suffix are dropped.
+                if len(zero) <= index:
                     continue
 
+                if (
+                    zero[index] not in group or (
+                        deleted and
+                        not _rulesAreIdentical(deleted, rule, index)
+                    )
+                ):
+                    result.append(rule)
+                else:
+                    deleted = rule
+                    counter += 1
+
             return result, counter, deleted
 
+        # Rules without the letter given by index, keyed by (id(rule), index).
+        # The rule itself is stored too, so its id can't be reused while the
+        # projection is cached.
+        projections = dict()
+
+        def _project(rule, index):
+            """Returns rule as nested tuples, where the letter given by
+            `index` is omitted from every string.
+            """
+
+            def _omit(el):
+                if el.__class__ is list or el.__class__ is tuple:
+                    return tuple(_omit(child) for child in el)
+
+                return el[:index] + el[index + 1:]
+
+            key = (id(rule), index)
+
+            if key not in projections:
+                projections[key] = (rule, _omit(rule))
+
+            return projections[key][1]
+
         def _rulesAreIdentical(a, b, index):
             """Check whether two groups are determine the same suffix (without)
             given index.
             """
-            if type(a) is type(b) is not list:
-                # This will omit the letter given by `index`
-                return a[:index] + a[index + 1:] == b[:index] + b[index + 1:]
-
-            return all(
-                _rulesAreIdentical(group1, group2, index)
-                for group1, group2 in
-                zip(a, b)
-            )
+
+            def _same(a, b):
+                # Equal projections are compared in one go, otherwise they
+                # are compared pairwise as far as both of them go.
+                if a == b:
+                    return True
+
+                if a.__class__ is b.__class__ is tuple:
+                    return all(_same(x, y) for x, y in zip(a, b))
+
+                return False
+
+            return _same(_project(a, index), _project(b, index))
 
         # Array of lengths of infinitive suffixes.
         lengths = [
@@ -546,20 +967,26 @@ class DeclenseTrainer:
             for rule in model
         ]
 
-        # Generalized groups will be stored here and added to `model` in
-        # the end.
-        extended = list()
+        # Arguments for `_generalize` will be stored here. The rules are
+        # generalized independently of each other in the end and added to
+        # `model`.
+        found = list()
 
         for group in groups:
 
+            # Only membership is checked here, while `_generalize` needs the
+            # letters in their order.
+            letters = frozenset(group)
+
             for index in range(0, max(lengths) + 1):
 
-                reduced, counter, element = _deleteGroup(model, group, index)
+                reduced, counter, element = _deleteGroup(
+                    model, letters, index)
 
                 if counter < len(group) * threshold or not element:
                     continue
 
-                extended.append(_generalize(element, index, group))
+                found.append((element, index, group))
                 model = reduced
 
-        return model + extended
+        return model + DeclenseTrainer._map(DeclenseTrainer._generalize, found)
@@ -1,25 +1,31 @@
 import setuptools
 
-setuptools.setup(
-    name="dclua",
-    version="2",
-    description="Library for word declensions",
-    long_description=open("README.md", encoding="utf-8").read(),
-    long_description_content_type="text/markdown",
-    url="https://github.com/syntpump/declensor",
-    license="MIT License",
-    author="Syntpump",
-    author_email="lynnporu@gmail.com",
-    classifiers=[
-        "Development Status :: 5 - Production/Stable",
-        "Intended Audience :: Developers",
-        "Intended Audience :: Science/Research",
-        "License :: OSI Approved :: MIT License"
-    ],
-    keywords="nlp",
-    packages=setuptools.find_packages(),
-    python_requires=">3",
-    project_urls={
-        "Syntpump on GitHub": "https://github.com/syntpump"
-    }
-)
+
+if __name__ == "__main__":
+
+    with open("readme.md", encoding="utf-8") as fp:
+        long_description = fp.read()
+
+    setuptools.setup(
+        name="dclua",
+        version="2",
+        description="Library for word declensions",
+        long_description=long_description,
+        long_description_content_type="text/markdown",
+        url="https://github.com/syntpump/declensor",
+        license="MIT License",
+        author="Syntpump",
+        author_email="lynnporu@gmail.com",
+        classifiers=[
+            "Development Status :: 5 - Production/Stable",
+            "Intended Audience :: Developers",
+            "Intended Audience :: Science/Research",
+            "License :: OSI Approved :: MIT License"
+        ],
+        keywords="nlp",
+        packages=setuptools.find_packages(),
+        python_requires=">3",
+        project_urls={
+            "Syntpump on GitHub": "https://github.com/syntpump"
+        }
+    )
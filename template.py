@@ -1,10 +1,20 @@
 """This is a template how declension models can be created.
 """
 
-import dclua
-import json
+from dclua import dclua
+from functools import lru_cache
 
-# Create declensions with one of the following template
+try:
+    from orjson import dumps
+except ImportError:
+    import json
+
+    def dumps(obj):
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Create declensions with one of the following template. Forms, which the
+# word doesn't have, can be left empty.
 
 noun = {
     # Infinitive
@@ -198,8 +208,47 @@ adjective = {
     (6, 1, 0): ''
 }
 
-# Paste here your dict
-with open(input("Enter the file to save in: ")) as fp:
-    fp.write(
-        json.dumps(
-            dclua.DeclenseTrainer(noun)))  # Paste here your dict
+
+@lru_cache(maxsize=8)
+def _encode(forms, cbor):
+    """Train the rule and encode it. Results are cached, so saving the same
+    forms again doesn't retrain them.
+
+    Args:
+        forms (tuple): Items of the template.
+        cbor (bool): Encode as CBOR instead of JSON.
+
+    Returns:
+        bytes: Encoded rule.
+
+    """
+
+    rule = dclua.DeclenseTrainer.analyze(dict(forms), sparse=True)
+
+    if cbor:
+        import cbor2
+        return cbor2.dumps(rule)
+
+    return dumps(rule)
+
+
+def save(path, template):
+    """Train the rule for a filled template and write it to a file.
+
+    Args:
+        path (str): Path of the file to save in. The rule is saved as CBOR
+            when the path ends with ".cbor" (requires cbor2) and as JSON
+            otherwise.
+        template (dict): One of the templates above.
+
+    """
+
+    data = _encode(tuple(sorted(template.items())), path.endswith(".cbor"))
+
+    with open(path, "wb", buffering=1 << 20) as fp:
+        fp.write(data)
+
+
+if __name__ == "__main__":
+    # Paste here your dict
+    save(input("Enter the file to save in: "), noun)